@@ -14,6 +14,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import os
+import sys
 import time
 from decimal import Decimal
 
@@ -40,7 +42,10 @@ from nautilus_trader.test_kit.providers import TestDataProvider
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 
 
-if __name__ == "__main__":
+def main(n_bars: int = 10_000) -> BacktestEngine:
+    """
+    Build and run the backtest over the first `n_bars` bid and ask bars.
+    """
     # Configure backtest engine
     config = BacktestEngineConfig(
         trader_id=TraderId("BACKTESTER-001"),
@@ -97,10 +102,10 @@ if __name__ == "__main__":
 
     # Add data
     bid_bars = bid_wrangler.process(
-        data=provider.read_csv_bars("fxcm/gbpusd-m1-bid-2012.csv")[:10_000],
+        data=provider.read_csv_bars("fxcm/gbpusd-m1-bid-2012.csv", nrows=n_bars),
     )
     ask_bars = ask_wrangler.process(
-        data=provider.read_csv_bars("fxcm/gbpusd-m1-ask-2012.csv")[:10_000],
+        data=provider.read_csv_bars("fxcm/gbpusd-m1-ask-2012.csv", nrows=n_bars),
     )
     engine.add_data(bid_bars)
     engine.add_data(ask_bars)
@@ -118,12 +123,20 @@ if __name__ == "__main__":
     strategy = EMACrossBracket(config=config)
     engine.add_strategy(strategy=strategy)
 
-    time.sleep(0.1)
-    input("Press Enter to continue...")
+    # Only block for confirmation when run interactively (not from CI or benchmarks)
+    if sys.stdin.isatty() and not os.environ.get("NAUTILUS_NONINTERACTIVE"):
+        time.sleep(0.1)
+        input("Press Enter to continue...")
 
     # Run the engine (from start to end of data)
     engine.run()
 
+    return engine
+
+
+if __name__ == "__main__":
+    engine = main()
+
     # Optionally view reports
     with pd.option_context(
         "display.max_rows",
@@ -133,7 +146,7 @@ if __name__ == "__main__":
         "display.width",
         300,
     ):
-        print(engine.trader.generate_account_report(SIM))
+        print(engine.trader.generate_account_report(Venue("SIM")))
         print(engine.trader.generate_order_fills_report())
         print(engine.trader.generate_positions_report())
 
@@ -47,10 +47,9 @@ impl UUID4 {
     #[must_use]
     pub fn new() -> Self {
         let uuid = Uuid::new_v4();
-        let c_string = CString::new(uuid.to_string()).expect("`CString` conversion failed");
-        let bytes = c_string.as_bytes_with_nul();
         let mut value = [0; UUID4_LEN];
-        value[..bytes.len()].copy_from_slice(bytes);
+        // Encode directly into the buffer (the final byte remains the null terminator)
+        uuid.hyphenated().encode_lower(&mut value[..UUID4_LEN - 1]);
 
         Self { value }
     }
@@ -138,6 +137,7 @@ mod tests {
         let uuid_parsed = Uuid::parse_str(&uuid_string).expect("Uuid::parse_str failed");
         assert_eq!(uuid_parsed.get_version().unwrap(), uuid::Version::Random);
         assert_eq!(uuid_parsed.to_string().len(), 36);
+        assert_eq!(uuid_parsed.to_string(), uuid_string);
     }
 
     #[rstest]
@@ -30,6 +30,14 @@ cdef class ExchangeRateCalculator:
         dict ask_quotes
     )
 
+    cdef object _get_quote(
+        self,
+        str symbol,
+        PriceType price_type,
+        dict bid_quotes,
+        dict ask_quotes,
+    )
+
 
 cdef class RolloverInterestCalculator:
     cdef dict _rate_data
@@ -82,6 +82,26 @@ cdef class ExchangeRateCalculator:
         if from_currency == to_currency:
             return 1.0  # No conversion necessary
 
+        # Fast path: the pair (or its inverse) is quoted directly, so there is
+        # no need to build (and infer) the full exchange rate table
+        quote = self._get_quote(
+            f"{from_currency.code}/{to_currency.code}",
+            price_type,
+            bid_quotes,
+            ask_quotes,
+        )
+        if quote is not None:
+            return quote
+
+        quote = self._get_quote(
+            f"{to_currency.code}/{from_currency.code}",
+            price_type,
+            bid_quotes,
+            ask_quotes,
+        )
+        if quote is not None:
+            return 1.0 / float(quote)
+
         if price_type == PriceType.BID:
             calculation_quotes = bid_quotes
         elif price_type == PriceType.ASK:
@@ -181,6 +201,26 @@ cdef class ExchangeRateCalculator:
 
         return quotes.get(to_currency.code, 0.0)
 
+    cdef object _get_quote(
+        self,
+        str symbol,
+        PriceType price_type,
+        dict bid_quotes,
+        dict ask_quotes,
+    ):
+        if price_type == PriceType.BID:
+            return bid_quotes.get(symbol)
+        elif price_type == PriceType.ASK:
+            return ask_quotes.get(symbol)
+        elif price_type == PriceType.MID:
+            bid = bid_quotes.get(symbol)
+            ask = ask_quotes.get(symbol)
+            if bid is None or ask is None:
+                return None
+            return (bid + ask) / 2.0
+        else:
+            return None
+
 
 cdef class RolloverInterestCalculator:
     """
@@ -14,7 +14,9 @@
 # -------------------------------------------------------------------------------------------------
 
 import pickle
+from bisect import bisect_left
 from decimal import Decimal
+from operator import attrgetter
 
 import pandas as pd
 
@@ -663,7 +665,10 @@ cdef class BacktestEngine:
         self._data.extend(data)
 
         if sort:
-            self._data = sorted(self._data, key=lambda x: x.ts_init)
+            # Sort in place (stable), avoids allocating a second full copy of the
+            # stream. As each added batch is typically already sorted, the sort
+            # reduces to a linear merge of the pre-sorted runs.
+            self._data.sort(key=attrgetter("ts_init"))
 
         self._log.info(
             f"Added {len(data):,} {data_added_str} element{'' if len(data) == 1 else 's'}",
@@ -908,6 +913,7 @@ cdef class BacktestEngine:
         start : datetime or str or int, optional
             The start datetime (UTC) for the backtest run.
             If ``None`` engine runs from the start of the data.
+            A `start` after the first data point requires the data stream to be sorted by `ts_init`.
         end : datetime or str or int, optional
             The end datetime (UTC) for the backtest run.
             If ``None`` engine runs to the end of the data.
@@ -1067,11 +1073,11 @@ cdef class BacktestEngine:
         self._data_len = len(self._data)
 
         # Set starting index
-        cdef uint64_t i
-        for i in range(self._data_len):
-            if start_ns <= self._data[i].ts_init:
-                self._index = i
-                break
+        if start_ns <= self._data[0].ts_init:
+            self._index = 0
+        else:
+            # Binary search, assumes the stream is sorted by `ts_init` (see `add_data`)
+            self._index = bisect_left(self._data, start_ns, key=attrgetter("ts_init"))
 
         # -- MAIN BACKTEST LOOP -----------------------------------------------#
         cdef bint force_stop = False
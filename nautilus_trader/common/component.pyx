@@ -1007,6 +1007,10 @@ cpdef str log_level_to_str(LogLevel value):
     return cstr_to_pystr(log_level_to_cstr(value))
 
 
+# The lowest level which can be written by any configured writer (set on initialization)
+cdef LogLevel LOGGING_LEVEL_MIN = LogLevel.DEBUG
+
+
 cdef class LogGuard:
     """
     Provides a `LogGuard` which serves as a token to signal the initialization
@@ -1083,6 +1087,8 @@ cpdef LogGuard init_logging(
         If the logging system has already been initialized.
 
     """
+    global LOGGING_LEVEL_MIN
+
     if trader_id is None:
         trader_id = TraderId("TRADER-000")
     if machine_id is None:
@@ -1107,6 +1113,14 @@ cpdef LogGuard init_logging(
         print_config,
     )
 
+    # Errors are always written to stderr, so are never filtered out
+    cdef LogLevel level_min = LogLevel.ERROR
+    if level_stdout != LogLevel.OFF and level_stdout < level_min:
+        level_min = level_stdout
+    if level_file != LogLevel.OFF and level_file < level_min:
+        level_min = level_file
+    LOGGING_LEVEL_MIN = level_min
+
     cdef LogGuard log_guard = LogGuard.__new__(LogGuard)
     log_guard._mem = log_guard_api
     return log_guard
@@ -1184,6 +1198,9 @@ cdef class Logger:
             )
             return
 
+        if LOGGING_LEVEL_MIN > LogLevel.DEBUG:
+            return  # Filtered by all writers, skip the message conversion and FFI call
+
         if not logging_is_initialized():
             return
 
@@ -1218,6 +1235,9 @@ cdef class Logger:
             )
             return
 
+        if LOGGING_LEVEL_MIN > LogLevel.INFO:
+            return  # Filtered by all writers, skip the message conversion and FFI call
+
         if not logging_is_initialized():
             return
 
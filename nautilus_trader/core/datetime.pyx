@@ -33,8 +33,14 @@ from nautilus_trader.core.nautilus_pyo3 import secs_to_millis as secs_to_millis
 from nautilus_trader.core.nautilus_pyo3 import secs_to_nanos as secs_to_nanos
 
 cimport cpython.datetime
+from cpython.datetime cimport datetime_day
+from cpython.datetime cimport datetime_hour
+from cpython.datetime cimport datetime_microsecond
+from cpython.datetime cimport datetime_minute
+from cpython.datetime cimport datetime_month
+from cpython.datetime cimport datetime_second
 from cpython.datetime cimport datetime_tzinfo
-from cpython.unicode cimport PyUnicode_Contains
+from cpython.datetime cimport datetime_year
 from libc.stdint cimport uint64_t
 
 from nautilus_trader.core.correctness cimport Condition
@@ -276,14 +282,13 @@ cpdef str format_iso8601(datetime dt):
         The formatted string.
 
     """
-    Condition.not_none(datetime, "datetime")
-
-    # Note the below is faster than `.isoformat()` or string formatting by 25%
-    # Have not tried char* manipulation
-    cdef str tz_stripped = str(dt).replace(' ', 'T', 1).rpartition('+')[0]
-
-    if not PyUnicode_Contains(tz_stripped, '.'):
-        return f"{tz_stripped}.000Z"
+    Condition.not_none(dt, "dt")
 
-    cdef tuple dt_partitioned = tz_stripped.rpartition('.')
-    return f"{dt_partitioned[0]}.{dt_partitioned[2][:3]}Z"
+    # Build the fixed width string directly from the datetime fields, which
+    # avoids the intermediate `str(dt)` (slow for `pd.Timestamp`) and the
+    # subsequent replace and partition passes over it
+    return (
+        f"{datetime_year(dt):04d}-{datetime_month(dt):02d}-{datetime_day(dt):02d}"
+        f"T{datetime_hour(dt):02d}:{datetime_minute(dt):02d}:{datetime_second(dt):02d}"
+        f".{datetime_microsecond(dt) // 1000:03d}Z"
+    )
@@ -19,3 +19,5 @@ from nautilus_trader.indicators.average.moving_average cimport MovingAverage
 cdef class ExponentialMovingAverage(MovingAverage):
     cdef readonly double alpha
     """The moving average alpha value.\n\n:returns: `double`"""
+
+    cpdef void update_raw_batch(self, const double[:] values)
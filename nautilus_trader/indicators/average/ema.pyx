@@ -106,3 +106,40 @@ cdef class ExponentialMovingAverage(MovingAverage):
 
         self.value = self.alpha * value + ((1.0 - self.alpha) * self.value)
         self._increment_count()
+
+    cpdef void update_raw_batch(self, const double[:] values):
+        """
+        Update the indicator with the given raw values (in order).
+
+        The result is equivalent to calling `update_raw` for each value, with
+        the recurrence computed in a single typed loop.
+
+        Parameters
+        ----------
+        values : numpy.ndarray
+            The update values (`float64`, may be read-only).
+
+        """
+        cdef Py_ssize_t n = values.shape[0]
+        if n == 0:
+            return
+
+        cdef double alpha = self.alpha
+        cdef double value = self.value
+        cdef Py_ssize_t i
+
+        # Check if this is the initial input
+        if not self.has_inputs:
+            value = values[0]
+
+        for i in range(n):
+            value = alpha * values[i] + ((1.0 - alpha) * value)
+
+        self.value = value
+        self.count += n
+
+        # Initialization logic
+        if not self.initialized:
+            self._set_has_inputs(True)
+            if self.count >= self.period:
+                self._set_initialized(True)
@@ -615,6 +615,12 @@ cdef class BarSpecification:
         return BarSpecification.check_information_aggregated_c(self.aggregation)
 
 
+# Bounded cache of bar types parsed from strings (bar types are immutable and
+# the same small set of strings is typically parsed repeatedly)
+cdef dict _BAR_TYPE_FROM_STR_CACHE = {}  # type: dict[str, BarType]
+cdef Py_ssize_t _BAR_TYPE_FROM_STR_CACHE_MAX = 1024
+
+
 cdef class BarType:
     """
     Represents a bar type including the instrument ID, bar specification and
@@ -745,12 +751,20 @@ cdef class BarType:
     cdef BarType from_str_c(str value):
         Condition.valid_string(value, "value")
 
+        cdef BarType bar_type = _BAR_TYPE_FROM_STR_CACHE.get(value)
+        if bar_type is not None:
+            return bar_type
+
         cdef str parse_err = cstr_to_pystr(bar_type_check_parsing(pystr_to_cstr(value)))
         if parse_err:
             raise ValueError(parse_err)
 
-        cdef BarType bar_type = BarType.__new__(BarType)
+        bar_type = BarType.__new__(BarType)
         bar_type._mem = bar_type_from_cstr(pystr_to_cstr(value))
+
+        if len(_BAR_TYPE_FROM_STR_CACHE) >= _BAR_TYPE_FROM_STR_CACHE_MAX:
+            _BAR_TYPE_FROM_STR_CACHE.clear()
+        _BAR_TYPE_FROM_STR_CACHE[value] = bar_type
         return bar_type
 
     @staticmethod
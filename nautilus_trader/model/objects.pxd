@@ -91,8 +91,6 @@ cdef class Price:
 
     cdef Price add(self, Price other)
     cdef Price sub(self, Price other)
-    cdef void add_assign(self, Price other)
-    cdef void sub_assign(self, Price other)
 
     @staticmethod
     cdef object _extract_decimal(object obj)
@@ -70,6 +70,11 @@ MONEY_MIN = RUST_MONEY_MIN
 FIXED_PRECISION = RUST_FIXED_PRECISION
 FIXED_SCALAR = RUST_FIXED_SCALAR
 
+# Bounded cache of prices parsed from strings (price strings are highly repetitive
+# in market data). Cleared when full to keep memory bounded.
+cdef dict _PRICE_FROM_STR_CACHE = {}  # type: dict[str, Price]
+cdef Py_ssize_t _PRICE_FROM_STR_CACHE_MAX = 65_536
+
 
 @cython.auto_pickle(True)
 cdef class Quantity:
@@ -740,7 +745,16 @@ cdef class Price:
 
     @staticmethod
     cdef Price from_str_c(str value):
-        return Price(float(value), precision=precision_from_cstr(pystr_to_cstr(value)))
+        cdef Price price = _PRICE_FROM_STR_CACHE.get(value)
+        if price is not None:
+            return price  # Price is an immutable value type
+
+        price = Price(float(value), precision=precision_from_cstr(pystr_to_cstr(value)))
+
+        if len(_PRICE_FROM_STR_CACHE) >= _PRICE_FROM_STR_CACHE_MAX:
+            _PRICE_FROM_STR_CACHE.clear()
+        _PRICE_FROM_STR_CACHE[value] = price
+        return price
 
     @staticmethod
     cdef Price from_int_c(int value):
@@ -779,12 +793,6 @@ cdef class Price:
     cdef Price sub(self, Price other):
         return Price.from_raw_c(self._mem.raw - other._mem.raw, self._mem.precision)
 
-    cdef void add_assign(self, Price other):
-        self._mem.raw += other._mem.raw
-
-    cdef void sub_assign(self, Price other):
-        self._mem.raw -= other._mem.raw
-
     cdef int64_t raw_int64_c(self):
         return self._mem.raw
 
@@ -111,4 +111,13 @@ cdef class BarDataWrangler:
     cdef readonly BarType bar_type
     cdef readonly Instrument instrument
 
-    cpdef Bar _build_bar(self, double[:] values, uint64_t ts_event, uint64_t ts_init_delta)
+    cpdef Bar _build_bar(
+        self,
+        double open,
+        double high,
+        double low,
+        double close,
+        double volume,
+        uint64_t ts_event,
+        uint64_t ts_init,
+    )
@@ -824,24 +824,38 @@ cdef class BarDataWrangler:
 
         ts_events, ts_inits = prepare_event_and_init_timestamps(data.index, ts_init_delta)
 
+        # Extract each column as a contiguous float64 array, avoiding the
+        # row-wise 2D copy (and per-row slicing) required by `data.values`
         return list(map(
             self._build_bar,
-            data.values,
+            data["open"].to_numpy(dtype=np.float64),
+            data["high"].to_numpy(dtype=np.float64),
+            data["low"].to_numpy(dtype=np.float64),
+            data["close"].to_numpy(dtype=np.float64),
+            data["volume"].to_numpy(dtype=np.float64),
             ts_events,
-            ts_inits
+            ts_inits,
         ))
 
     # cpdef method for Python wrap() (called with map)
-    cpdef Bar _build_bar(self, double[:] values, uint64_t ts_event, uint64_t ts_init):
-        # Build a bar from the given index and values. The function expects the
-        # values to be an ndarray with 5 elements [open, high, low, close, volume].
+    cpdef Bar _build_bar(
+        self,
+        double open,
+        double high,
+        double low,
+        double close,
+        double volume,
+        uint64_t ts_event,
+        uint64_t ts_init,
+    ):
+        cdef int price_prec = self.instrument.price_precision
         return Bar(
             bar_type=self.bar_type,
-            open=Price(values[0], self.instrument.price_precision),
-            high=Price(values[1], self.instrument.price_precision),
-            low=Price(values[2], self.instrument.price_precision),
-            close=Price(values[3], self.instrument.price_precision),
-            volume=Quantity(values[4], self.instrument.size_precision),
+            open=Price(open, price_prec),
+            high=Price(high, price_prec),
+            low=Price(low, price_prec),
+            close=Price(close, price_prec),
+            volume=Quantity(volume, self.instrument.size_precision),
             ts_event=ts_event,
             ts_init=ts_init,
         )
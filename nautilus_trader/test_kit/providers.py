@@ -22,6 +22,7 @@ from typing import Any
 import fsspec
 import numpy as np
 import pandas as pd
+import pyarrow.csv as pcsv
 import pytz
 from fsspec.implementations.local import LocalFileSystem
 
@@ -745,10 +746,23 @@ class TestDataProvider:
         with fsspec.open(uri) as f:
             return CSVTickDataLoader.load(file_path=f)
 
-    def read_csv_bars(self, path: str) -> pd.DataFrame:
+    def read_csv_bars(self, path: str, **kwargs: Any) -> pd.DataFrame:
+        # Additional kwargs (e.g. `nrows`, `skiprows`) are forwarded to `pd.read_csv`,
+        # so row limits are applied while parsing rather than after the full file is loaded.
         uri = self._make_uri(path=path)
         with fsspec.open(uri) as f:
-            return CSVBarDataLoader.load(file_path=f)
+            if kwargs:
+                # Round trip float parsing gives the same (correctly rounded) values
+                # as the Arrow parser below, so both paths agree on every row.
+                kwargs.setdefault("float_precision", "round_trip")
+                return CSVBarDataLoader.load(file_path=f, **kwargs)
+
+            # Full file reads use the multi-threaded Arrow CSV parser
+            table = pcsv.read_csv(f, read_options=pcsv.ReadOptions(use_threads=True))
+
+        df = table.to_pandas(self_destruct=True).set_index("timestamp")
+        df.index = pd.to_datetime(df.index, format="mixed").as_unit("ns")
+        return df
 
     def read_parquet_ticks(self, path: str, timestamp_column: str = "timestamp") -> pd.DataFrame:
         uri = self._make_uri(path=path)
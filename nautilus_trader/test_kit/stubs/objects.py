@@ -0,0 +1,49 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+from functools import lru_cache
+
+from nautilus_trader.model.objects import Currency
+from nautilus_trader.model.objects import Money
+
+
+class TestObjectStubs:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def money(amount: float, currency: Currency) -> Money:
+        # Money is an immutable value type, so repeated fixture values can share an instance
+        return Money(amount, currency)
+
+
+class CurrencyFactory:
+    """
+    Provides a factory for `Money` values bound to a single currency.
+
+    Instances are shared between calls through the `TestObjectStubs.money` cache.
+
+    Parameters
+    ----------
+    currency : Currency
+        The currency for the `Money` values created.
+
+    """
+
+    __slots__ = ("currency",)
+
+    def __init__(self, currency: Currency) -> None:
+        self.currency = currency
+
+    def __call__(self, amount: float) -> Money:
+        return TestObjectStubs.money(amount, self.currency)
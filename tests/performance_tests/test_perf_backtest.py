@@ -13,10 +13,14 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import importlib.util
+import sys
 from datetime import datetime
 from decimal import Decimal
+from types import ModuleType
 
 import pandas as pd
+import pytest
 import pytz
 
 from nautilus_trader.backtest.engine import BacktestEngine
@@ -38,10 +42,24 @@ from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.data import TestDataStubs
 from nautilus_trader.trading.strategy import Strategy
 from tests import TEST_DATA_DIR
+from tests import TESTS_PACKAGE_ROOT
 
 
 USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
 
+EXAMPLES_BACKTEST_DIR = TESTS_PACKAGE_ROOT.parent / "examples" / "backtest"
+
+
+def _load_example(name: str, monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    # The examples are scripts rather than a package, so load the module from its path
+    # (registered in `sys.modules` for the duration of the test only)
+    spec = importlib.util.spec_from_file_location(name, EXAMPLES_BACKTEST_DIR / f"{name}.py")
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, name, module)
+    spec.loader.exec_module(module)
+    return module
+
 
 def test_run_with_empty_strategy(benchmark):
     def setup():
@@ -174,3 +192,13 @@ def test_run_with_ema_cross_strategy(benchmark):
         engine.run(start=start, end=end)
 
     benchmark.pedantic(run, setup=setup, rounds=1, iterations=1)
+
+
+def test_run_fx_ema_cross_bracket_gbpusd_bars_external_example(benchmark, monkeypatch):
+    # Skip the example's interactive prompt, even when stdin is a TTY (e.g. `pytest -s`)
+    monkeypatch.setenv("NAUTILUS_NONINTERACTIVE", "1")
+    example = _load_example("fx_ema_cross_bracket_gbpusd_bars_external", monkeypatch)
+
+    engine = benchmark.pedantic(example.main, kwargs={"n_bars": 10_000}, rounds=1, iterations=1)
+
+    engine.dispose()
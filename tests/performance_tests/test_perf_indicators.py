@@ -0,0 +1,46 @@
+# -------------------------------------------------------------------------------------------------
+#  Copyright (C) 2015-2024 Nautech Systems Pty Ltd. All rights reserved.
+#  https://nautechsystems.io
+#
+#  Licensed under the GNU Lesser General Public License Version 3.0 (the "License");
+#  You may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at https://www.gnu.org/licenses/lgpl-3.0.en.html
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+# -------------------------------------------------------------------------------------------------
+
+import numpy as np
+
+from nautilus_trader.indicators.average.ema import ExponentialMovingAverage
+
+
+CLOSES = np.random.default_rng(10).random(10_000)
+
+
+def test_ema_update_raw(benchmark):
+    def update_raw() -> None:
+        ema = ExponentialMovingAverage(10)
+        for close in CLOSES:
+            ema.update_raw(close)
+
+    benchmark.pedantic(
+        target=update_raw,
+        rounds=100,
+        iterations=1,
+    )
+
+
+def test_ema_update_raw_batch(benchmark):
+    def update_raw_batch() -> None:
+        ema = ExponentialMovingAverage(10)
+        ema.update_raw_batch(CLOSES)
+
+    benchmark.pedantic(
+        target=update_raw_batch,
+        rounds=100,
+        iterations=1,
+    )
@@ -16,6 +16,8 @@
 import random
 from typing import Any
 
+import pytest
+
 from nautilus_trader.common.component import Logger
 from nautilus_trader.common.component import init_logging
 from nautilus_trader.common.component import is_logging_initialized
@@ -24,7 +26,7 @@ from nautilus_trader.common.enums import LogLevel
 
 def test_logging(benchmark: Any) -> None:
     random.seed(45362718)
-    if not is_logging_initialized:
+    if not is_logging_initialized():
         init_logging(level_stdout=LogLevel.ERROR, bypass=True)
 
     logger = Logger(name="TEST_LOGGER")
@@ -70,3 +72,27 @@ def test_logging(benchmark: Any) -> None:
             logger.info(f"{i}: {message}")
 
     benchmark.pedantic(run, rounds=10, iterations=2, warmup_rounds=1)
+
+
+@pytest.mark.parametrize(
+    "level",
+    [
+        LogLevel.DEBUG,
+        LogLevel.INFO,
+        LogLevel.WARNING,
+        LogLevel.ERROR,
+    ],
+)
+def test_logging_by_level(benchmark: Any, level: LogLevel) -> None:
+    if not is_logging_initialized():
+        init_logging(level_stdout=LogLevel.ERROR, bypass=True)
+
+    logger = Logger(name="TEST_LOGGER")
+    log = {
+        LogLevel.DEBUG: logger.debug,
+        LogLevel.INFO: logger.info,
+        LogLevel.WARNING: logger.warning,
+        LogLevel.ERROR: logger.error,
+    }[level]
+
+    benchmark(log, "This is a log message.")
@@ -145,6 +145,77 @@ class TestExchangeRateCalculator:
         # Assert
         assert result == 0.009082652134423252
 
+    def test_get_rate_when_direct_quote_and_inference_available_returns_direct_quote(self):
+        # Arrange
+        converter = ExchangeRateCalculator()
+        bid_rates = {
+            "AUD/JPY": 88.000,
+            "AUD/USD": 0.80000,
+            "USD/JPY": 110.100,
+        }
+        ask_rates = {
+            "AUD/JPY": 88.010,
+            "AUD/USD": 0.80010,
+            "USD/JPY": 110.130,
+        }
+
+        # Act
+        result1 = converter.get_rate(
+            AUD,
+            JPY,
+            PriceType.BID,
+            bid_rates,
+            ask_rates,
+        )
+
+        result2 = converter.get_rate(
+            JPY,
+            AUD,
+            PriceType.ASK,
+            bid_rates,
+            ask_rates,
+        )
+
+        # Assert
+        assert result1 == 88.000
+        assert result2 == 1.0 / 88.010
+
+    def test_get_rate_for_mid_when_direct_and_inverse_quotes_available(self):
+        # Arrange
+        converter = ExchangeRateCalculator()
+        bid_rates = {
+            "AUD/JPY": 88.000,
+            "AUD/USD": 0.80000,
+            "USD/JPY": 110.100,
+        }
+        ask_rates = {
+            "AUD/JPY": 88.010,
+            "AUD/USD": 0.80010,
+            "USD/JPY": 110.130,
+        }
+
+        # Act
+        result1 = converter.get_rate(
+            AUD,
+            JPY,
+            PriceType.MID,
+            bid_rates,
+            ask_rates,
+        )
+
+        result2 = converter.get_rate(
+            JPY,
+            AUD,
+            PriceType.MID,
+            bid_rates,
+            ask_rates,
+        )
+
+        # Assert (as calculated by the exchange rate table from the mid quotes)
+        mid = (88.000 + 88.010) / 2.0
+        assert result1 == mid
+        assert result2 == 1.0 / mid
+
     def test_calculate_exchange_rate_by_inference(self):
         # Arrange
         converter = ExchangeRateCalculator()
@@ -18,7 +18,6 @@ import pytest
 from nautilus_trader.accounting.accounts.cash import CashAccount
 from nautilus_trader.common.component import TestClock
 from nautilus_trader.common.factories import OrderFactory
-from nautilus_trader.core.uuid import UUID4
 from nautilus_trader.model.currencies import ADA
 from nautilus_trader.model.currencies import AUD
 from nautilus_trader.model.currencies import BTC
@@ -43,6 +42,7 @@ from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.events import TestEventStubs
 from nautilus_trader.test_kit.stubs.execution import TestExecStubs
 from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
+from nautilus_trader.test_kit.stubs.objects import CurrencyFactory
 
 
 AUDUSD_SIM = TestInstrumentProvider.default_fx_ccy("AUD/USD")
@@ -50,6 +50,12 @@ USDJPY_SIM = TestInstrumentProvider.default_fx_ccy("USD/JPY")
 ADABTC_BINANCE = TestInstrumentProvider.adabtc_binance()
 BTCUSDT_BINANCE = TestInstrumentProvider.btcusdt_binance()
 AAPL_XNAS = TestInstrumentProvider.equity(symbol="AAPL", venue="XNAS")
+SIM_000 = AccountId("SIM-000")
+SIM_001 = AccountId("SIM-001")
+USD_MONEY = CurrencyFactory(USD)
+BTC_MONEY = CurrencyFactory(BTC)
+ETH_MONEY = CurrencyFactory(ETH)
+ADA_MONEY = CurrencyFactory(ADA)
 
 
 class TestCashAccount:
@@ -85,20 +91,20 @@ class TestCashAccount:
     def test_instantiate_single_asset_cash_account(self):
         # Arrange
         event = AccountState(
-            account_id=AccountId("SIM-000"),
+            account_id=SIM_000,
             account_type=AccountType.CASH,
             base_currency=USD,
             reported=True,
             balances=[
                 AccountBalance(
-                    Money(1_000_000, USD),
-                    Money(0, USD),
-                    Money(1_000_000, USD),
+                    USD_MONEY(1_000_000),
+                    USD_MONEY(0),
+                    USD_MONEY(1_000_000),
                 ),
             ],
             margins=[],
             info={},
-            event_id=UUID4(),
+            event_id=TestIdStubs.uuid(),
             ts_event=0,
             ts_init=0,
         )
@@ -121,25 +127,25 @@ class TestCashAccount:
     def test_instantiate_multi_asset_cash_account(self):
         # Arrange
         event = AccountState(
-            account_id=AccountId("SIM-000"),
+            account_id=SIM_000,
             account_type=AccountType.CASH,
             base_currency=None,  # Multi-currency
             reported=True,
             balances=[
                 AccountBalance(
-                    Money(10.00000000, BTC),
-                    Money(0.00000000, BTC),
-                    Money(10.00000000, BTC),
+                    BTC_MONEY(10.00000000),
+                    BTC_MONEY(0.00000000),
+                    BTC_MONEY(10.00000000),
                 ),
                 AccountBalance(
-                    Money(20.00000000, ETH),
-                    Money(0.00000000, ETH),
-                    Money(20.00000000, ETH),
+                    ETH_MONEY(20.00000000),
+                    ETH_MONEY(0.00000000),
+                    ETH_MONEY(20.00000000),
                 ),
             ],
             margins=[],
             info={},  # No default currency set
-            event_id=UUID4(),
+            event_id=TestIdStubs.uuid(),
             ts_event=0,
             ts_init=0,
         )
@@ -175,25 +181,25 @@ class TestCashAccount:
     def test_apply_given_new_state_event_updates_correctly(self):
         # Arrange
         event1 = AccountState(
-            account_id=AccountId("SIM-001"),
+            account_id=SIM_001,
             account_type=AccountType.CASH,
             base_currency=None,  # Multi-currency
             reported=True,
             balances=[
                 AccountBalance(
-                    Money(10.00000000, BTC),
-                    Money(0.00000000, BTC),
-                    Money(10.00000000, BTC),
+                    BTC_MONEY(10.00000000),
+                    BTC_MONEY(0.00000000),
+                    BTC_MONEY(10.00000000),
                 ),
                 AccountBalance(
-                    Money(20.00000000, ETH),
-                    Money(0.00000000, ETH),
-                    Money(20.00000000, ETH),
+                    ETH_MONEY(20.00000000),
+                    ETH_MONEY(0.00000000),
+                    ETH_MONEY(20.00000000),
                 ),
             ],
             margins=[],
             info={},  # No default currency set
-            event_id=UUID4(),
+            event_id=TestIdStubs.uuid(),
             ts_event=0,
             ts_init=0,
         )
@@ -202,25 +208,25 @@ class TestCashAccount:
         account = CashAccount(event1)
 
         event2 = AccountState(
-            account_id=AccountId("SIM-001"),
+            account_id=SIM_001,
             account_type=AccountType.CASH,
             base_currency=None,  # Multi-currency
             reported=True,
             balances=[
                 AccountBalance(
-                    Money(9.00000000, BTC),
-                    Money(0.50000000, BTC),
-                    Money(8.50000000, BTC),
+                    BTC_MONEY(9.00000000),
+                    BTC_MONEY(0.50000000),
+                    BTC_MONEY(8.50000000),
                 ),
                 AccountBalance(
-                    Money(20.00000000, ETH),
-                    Money(0.00000000, ETH),
-                    Money(20.00000000, ETH),
+                    ETH_MONEY(20.00000000),
+                    ETH_MONEY(0.00000000),
+                    ETH_MONEY(20.00000000),
                 ),
             ],
             margins=[],
             info={},  # No default currency set
-            event_id=UUID4(),
+            event_id=TestIdStubs.uuid(),
             ts_event=0,
             ts_init=0,
         )
@@ -239,91 +245,32 @@ class TestCashAccount:
         assert account.balance_free(ETH) == Money(20.00000000, ETH)
         assert account.balance_locked(ETH) == Money(0.00000000, ETH)
 
-    def test_calculate_balance_locked_buy(self):
-        # Arrange
-        event = AccountState(
-            account_id=AccountId("SIM-001"),
-            account_type=AccountType.CASH,
-            base_currency=USD,
-            reported=True,
-            balances=[
-                AccountBalance(
-                    Money(1_000_000.00, USD),
-                    Money(0.00, USD),
-                    Money(1_000_000.00, USD),
-                ),
-            ],
-            margins=[],
-            info={},  # No default currency set
-            event_id=UUID4(),
-            ts_event=0,
-            ts_init=0,
-        )
-
-        account = CashAccount(event)
-
-        # Act
-        result = account.calculate_balance_locked(
-            instrument=AUDUSD_SIM,
-            side=OrderSide.BUY,
-            quantity=Quantity.from_int(1_000_000),
-            price=Price.from_str("0.80"),
-        )
-
-        # Assert
-        assert result == Money(800_032.00, USD)  # Notional + expected commission
-
-    def test_calculate_balance_locked_sell(self):
-        # Arrange
-        event = AccountState(
-            account_id=AccountId("SIM-001"),
-            account_type=AccountType.CASH,
-            base_currency=USD,
-            reported=True,
-            balances=[
-                AccountBalance(
-                    Money(1_000_000.00, USD),
-                    Money(0.00, USD),
-                    Money(1_000_000.00, USD),
-                ),
-            ],
-            margins=[],
-            info={},  # No default currency set
-            event_id=UUID4(),
-            ts_event=0,
-            ts_init=0,
-        )
-
-        account = CashAccount(event)
-
-        # Act
-        result = account.calculate_balance_locked(
-            instrument=AUDUSD_SIM,
-            side=OrderSide.SELL,
-            quantity=Quantity.from_int(1_000_000),
-            price=Price.from_str("0.80"),
-        )
-
-        # Assert
-        assert result == Money(1_000_040.00, AUD)  # Notional + expected commission
-
-    def test_calculate_balance_locked_sell_no_base_currency(self):
+    @pytest.mark.parametrize(
+        ("instrument", "side", "quantity", "price", "expected"),
+        [
+            # Notional + expected commission
+            [AUDUSD_SIM, OrderSide.BUY, 1_000_000, "0.80", Money(800_032.00, USD)],
+            [AUDUSD_SIM, OrderSide.SELL, 1_000_000, "0.80", Money(1_000_040.00, AUD)],
+            [AAPL_XNAS, OrderSide.SELL, 100, "1500.00", Money(100.00, USD)],
+        ],
+    )
+    def test_calculate_balance_locked(self, instrument, side, quantity, price, expected):
         # Arrange
         event = AccountState(
-            account_id=AccountId("SIM-001"),
+            account_id=SIM_001,
             account_type=AccountType.CASH,
             base_currency=USD,
             reported=True,
             balances=[
                 AccountBalance(
-                    Money(1_000_000.00, USD),
-                    Money(0.00, USD),
-                    Money(1_000_000.00, USD),
+                    USD_MONEY(1_000_000.00),
+                    USD_MONEY(0.00),
+                    USD_MONEY(1_000_000.00),
                 ),
             ],
             margins=[],
             info={},  # No default currency set
-            event_id=UUID4(),
+            event_id=TestIdStubs.uuid(),
             ts_event=0,
             ts_init=0,
         )
@@ -332,32 +279,32 @@ class TestCashAccount:
 
         # Act
         result = account.calculate_balance_locked(
-            instrument=AAPL_XNAS,
-            side=OrderSide.SELL,
-            quantity=Quantity.from_int(100),
-            price=Price.from_str("1500.00"),
+            instrument=instrument,
+            side=side,
+            quantity=Quantity.from_int(quantity),
+            price=Price.from_str(price),
         )
 
         # Assert
-        assert result == Money(100.00, USD)  # Notional + expected commission
+        assert result == expected
 
     def test_calculate_pnls_for_single_currency_cash_account(self):
         # Arrange
         event = AccountState(
-            account_id=AccountId("SIM-001"),
+            account_id=SIM_001,
             account_type=AccountType.CASH,
             base_currency=USD,
             reported=True,
             balances=[
                 AccountBalance(
-                    Money(1_000_000.00, USD),
-                    Money(0.00, USD),
-                    Money(1_000_000.00, USD),
+                    USD_MONEY(1_000_000.00),
+                    USD_MONEY(0.00),
+                    USD_MONEY(1_000_000.00),
                 ),
             ],
             margins=[],
             info={},  # No default currency set
-            event_id=UUID4(),
+            event_id=TestIdStubs.uuid(),
             ts_event=0,
             ts_init=0,
         )
@@ -393,25 +340,25 @@ class TestCashAccount:
     def test_calculate_pnls_for_multi_currency_cash_account_btcusdt(self):
         # Arrange
         event = AccountState(
-            account_id=AccountId("SIM-001"),
+            account_id=SIM_001,
             account_type=AccountType.CASH,
             base_currency=None,  # Multi-currency
             reported=True,
             balances=[
                 AccountBalance(
-                    Money(10.00000000, BTC),
-                    Money(0.00000000, BTC),
-                    Money(10.00000000, BTC),
+                    BTC_MONEY(10.00000000),
+                    BTC_MONEY(0.00000000),
+                    BTC_MONEY(10.00000000),
                 ),
                 AccountBalance(
-                    Money(20.00000000, ETH),
-                    Money(0.00000000, ETH),
-                    Money(20.00000000, ETH),
+                    ETH_MONEY(20.00000000),
+                    ETH_MONEY(0.00000000),
+                    ETH_MONEY(20.00000000),
                 ),
             ],
             margins=[],
             info={},  # No default currency set
-            event_id=UUID4(),
+            event_id=TestIdStubs.uuid(),
             ts_event=0,
             ts_init=0,
         )
@@ -468,25 +415,25 @@ class TestCashAccount:
     def test_calculate_pnls_for_multi_currency_cash_account_adabtc(self):
         # Arrange
         event = AccountState(
-            account_id=AccountId("SIM-001"),
+            account_id=SIM_001,
             account_type=AccountType.CASH,
             base_currency=None,  # Multi-currency
             reported=True,
             balances=[
                 AccountBalance(
-                    Money(1.00000000, BTC),
-                    Money(0.00000000, BTC),
-                    Money(1.00000000, BTC),
+                    BTC_MONEY(1.00000000),
+                    BTC_MONEY(0.00000000),
+                    BTC_MONEY(1.00000000),
                 ),
                 AccountBalance(
-                    Money(1000.00000000, ADA),
-                    Money(0.00000000, ADA),
-                    Money(1000.00000000, ADA),
+                    ADA_MONEY(1000.00000000),
+                    ADA_MONEY(0.00000000),
+                    ADA_MONEY(1000.00000000),
                 ),
             ],
             margins=[],
             info={},  # No default currency set
-            event_id=UUID4(),
+            event_id=TestIdStubs.uuid(),
             ts_event=0,
             ts_init=0,
         )
@@ -14,11 +14,15 @@
 # -------------------------------------------------------------------------------------------------
 
 
+import pytest
+
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.identifiers import Symbol
 from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.objects import Price
+from nautilus_trader.persistence.loaders import CSVBarDataLoader
 from nautilus_trader.persistence.loaders import ParquetTickDataLoader
+from nautilus_trader.test_kit.providers import TestDataProvider
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from tests import TEST_DATA_DIR
 
@@ -53,6 +57,49 @@ class TestBacktestLoaders:
         assert instrument.quote_currency.code == "JPY"
 
 
+class TestCSVBarDataLoaders:
+    @pytest.mark.parametrize(
+        ("path", "columns"),
+        [
+            ["fxcm/gbpusd-m1-bid-2012.csv", ["open", "high", "low", "close"]],
+            ["btc-perp-20211231-20220201_1m.csv", ["open", "high", "low", "close", "volume"]],
+        ],
+    )
+    def test_read_csv_bars_with_nrows_returns_expected_rows(self, path, columns):
+        # Arrange
+        provider = TestDataProvider()
+        expected = provider.read_csv_bars(path)[:1_000]
+
+        # Act
+        bars = provider.read_csv_bars(path, nrows=1_000)
+
+        # Assert
+        assert len(bars) == 1_000
+        assert list(bars.columns) == columns
+        assert bars.equals(expected)
+
+    @pytest.mark.parametrize(
+        ("path", "columns"),
+        [
+            ["fxcm/gbpusd-m1-bid-2012.csv", ["open", "high", "low", "close"]],
+            ["btc-perp-20211231-20220201_1m.csv", ["open", "high", "low", "close", "volume"]],
+        ],
+    )
+    def test_read_csv_bars_matches_csv_bar_data_loader(self, path, columns):
+        # Arrange
+        # The default pandas float parser can differ from the correctly rounded value
+        # in the last bit (e.g. for some `volume` values), so compare with round trip parsing
+        expected = CSVBarDataLoader.load(TEST_DATA_DIR / path, float_precision="round_trip")
+
+        # Act
+        bars = TestDataProvider().read_csv_bars(path)
+
+        # Assert
+        assert bars.index.name == "timestamp"
+        assert list(bars.columns) == columns
+        assert bars.equals(expected)
+
+
 class TestParquetTickDataLoaders:
     def test_btcusdt_trade_ticks_from_parquet_loader_return_expected_row(self):
         # Arrange, Act
@@ -284,6 +284,23 @@ class TestBarDataWrangler:
         assert bars[0].ts_event == 1328054400000000000
         assert bars[0].ts_init == 1328054400001000500  # <-- delta diff
 
+    def test_process_with_reordered_columns(self):
+        # Arrange
+        provider = TestDataProvider()
+        data = provider.read_csv_bars("fxcm/gbpusd-m1-bid-2012.csv")[:1000]
+        data = data[["close", "low", "high", "open"]]
+
+        # Act
+        bars = self.wrangler.process(data)
+
+        # Assert
+        assert len(bars) == 1000
+        assert bars[0].open == Price.from_str("1.57597")
+        assert bars[0].high == Price.from_str("1.57606")
+        assert bars[0].low == Price.from_str("1.57576")
+        assert bars[0].close == Price.from_str("1.57576")
+        assert bars[0].volume == Quantity.from_int(1_000_000)
+
 
 class TestBarDataWranglerHeaderless:
     def setup(self):
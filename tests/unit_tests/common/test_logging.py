@@ -12,6 +12,10 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
 
 import pytest
 
@@ -22,6 +26,44 @@ from nautilus_trader.common.enums import log_level_from_str
 from nautilus_trader.common.enums import log_level_to_str
 
 
+# Logging can only be initialized once per process (the test session already has it
+# initialized at DEBUG), so level filtering is exercised in a fresh interpreter.
+LOGGING_LEVEL_SCRIPT = textwrap.dedent(
+    """
+    import sys
+
+    from nautilus_trader.common.component import Logger
+    from nautilus_trader.common.component import init_logging
+    from nautilus_trader.common.enums import log_level_from_str
+
+    log_guard = init_logging(
+        level_stdout=log_level_from_str("INFO"),
+        level_file=log_level_from_str(sys.argv[1]),
+        directory=sys.argv[2],
+        file_name="test",
+        colors=False,
+        bypass=False,
+    )
+
+    logger = Logger(name="TEST_LOGGER")
+    logger.debug("This is a debug message.")
+    logger.info("This is an info message.")
+    logger.error("This is an error message.")
+
+    del log_guard  # Flushes the writers
+    """,
+)
+
+
+def run_logging_level_script(level_file: str, directory: Path) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-c", LOGGING_LEVEL_SCRIPT, level_file, str(directory)],  # noqa
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
 class TestLogLevel:
     @pytest.mark.parametrize(
         ("enum", "expected"),
@@ -58,80 +100,64 @@ class TestLogLevel:
 
 
 class TestLoggerTests:
-    def test_name(self):
-        # Arrange
-        name = "TEST_LOGGER"
-        logger = Logger(name=name)
-
-        # Act, Assert
-        assert logger.name == name
-
-    def test_log_debug_messages_to_console(self):
-        # Arrange
-        logger = Logger(name="TEST_LOGGER")
-
-        # Act
-        logger.debug("This is a log message.")
-
-        # Assert
-        assert True  # No exceptions raised
-
-    def test_log_info_messages_to_console(self):
-        # Arrange
-        logger = Logger(name="TEST_LOGGER")
-
-        # Act
-        logger.info("This is a log message.")
-
-        # Assert
-        assert True  # No exceptions raised
+    def setup(self):
+        # Fixture Setup
+        self.logger = Logger(name="TEST_LOGGER")
 
-    def test_log_info_messages_to_console_with_blue_colour(self):
-        # Arrange
-        logger = Logger(name="TEST_LOGGER")
-
-        # Act
-        logger.info("This is a log message.", color=LogColor.BLUE)
-
-        # Assert
-        assert True  # No exceptions raised
+    def test_name(self):
+        # Arrange, Act, Assert
+        assert self.logger.name == "TEST_LOGGER"
 
-    def test_log_info_messages_to_console_with_green_colour(self):
+    @pytest.mark.parametrize(
+        ("method", "color"),
+        [
+            ["debug", LogColor.NORMAL],
+            ["info", LogColor.NORMAL],
+            ["info", LogColor.BLUE],
+            ["info", LogColor.GREEN],
+            ["warning", LogColor.YELLOW],
+            ["error", LogColor.RED],
+        ],
+    )
+    def test_log_messages_to_console(self, method, color):
         # Arrange
-        logger = Logger(name="TEST_LOGGER")
+        log = getattr(self.logger, method)
 
         # Act
-        logger.info("This is a log message.", color=LogColor.GREEN)
+        log("This is a log message.", color=color)
 
         # Assert
         assert True  # No exceptions raised
 
-    def test_log_warning_messages_to_console(self):
-        # Arrange
-        logger = Logger(name="TEST_LOGGER")
-
-        # Act
-        logger.warning("This is a log message.")
+    def test_log_exception_messages_to_console(self):
+        # Arrange, Act
+        self.logger.exception("We intentionally divided by zero!", ZeroDivisionError("Oops"))
 
         # Assert
         assert True  # No exceptions raised
 
-    def test_log_error_messages_to_console(self):
-        # Arrange
-        logger = Logger(name="TEST_LOGGER")
 
-        # Act
-        logger.error("This is a log message.")
+class TestLoggingLevelFilter:
+    def test_debug_filtered_when_below_all_writer_levels(self, tmp_path):
+        # Arrange, Act
+        result = run_logging_level_script(level_file="OFF", directory=tmp_path)
 
         # Assert
-        assert True  # No exceptions raised
+        assert "This is a debug message." not in result.stdout
+        assert "This is a debug message." not in result.stderr
+        assert "This is an info message." in result.stdout
+        assert "This is an error message." in result.stderr
+        assert not (tmp_path / "test.log").exists()
 
-    def test_log_exception_messages_to_console(self):
-        # Arrange
-        logger = Logger(name="TEST_LOGGER")
-
-        # Act
-        logger.exception("We intentionally divided by zero!", ZeroDivisionError("Oops"))
+    def test_debug_written_to_file_when_file_level_is_debug(self, tmp_path):
+        # Arrange, Act
+        result = run_logging_level_script(level_file="DEBUG", directory=tmp_path)
 
         # Assert
-        assert True  # No exceptions raised
+        log_file = (tmp_path / "test.log").read_text()
+        assert "This is a debug message." not in result.stdout
+        assert "This is an info message." in result.stdout
+        assert "This is an error message." in result.stderr
+        assert "This is a debug message." in log_file
+        assert "This is an info message." in log_file
+        assert "This is an error message." in log_file
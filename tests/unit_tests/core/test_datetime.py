@@ -330,6 +330,19 @@ class TestDatetimeFunctions:
         assert result4 == "1970-01-01T00:00:01.000Z"
         assert result5 == "1970-01-01T01:01:02.003Z"
 
+    def test_format_iso8601_with_pd_timestamp_and_naive_datetime(self):
+        # Arrange
+        dt1 = pd.Timestamp("2024-03-10 09:08:07.654321987", tz="UTC")
+        dt2 = datetime(2024, 3, 10, 9, 8, 7, 654321)
+
+        # Act
+        result1 = format_iso8601(dt1)
+        result2 = format_iso8601(dt2)
+
+        # Assert
+        assert result1 == "2024-03-10T09:08:07.654Z"
+        assert result2 == "2024-03-10T09:08:07.654Z"
+
     def test_datetime_and_pd_timestamp_equality(self):
         # Arrange
         timestamp1 = datetime(1970, 1, 1, 0, 0, 0, 0)
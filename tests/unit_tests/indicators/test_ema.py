@@ -15,6 +15,7 @@
 
 from decimal import Decimal
 
+import numpy as np
 import pytest
 
 from nautilus_trader.indicators.average.ema import ExponentialMovingAverage
@@ -127,6 +128,46 @@ class TestExponentialMovingAverage:
         # Act, Assert
         assert self.ema.value == pytest.approx(1.5123966942148757, rel=1e-9)
 
+    def test_update_raw_batch_matches_sequential_updates(self):
+        # Arrange
+        values = np.linspace(1.0, 2.0, 20)
+        expected = ExponentialMovingAverage(10)
+        for value in values:
+            expected.update_raw(value)
+
+        # Act
+        self.ema.update_raw_batch(values)
+
+        # Assert
+        assert self.ema.value == pytest.approx(expected.value, rel=1e-12)
+        assert self.ema.count == 20
+        assert self.ema.has_inputs
+        assert self.ema.initialized
+
+    def test_update_raw_batch_with_read_only_array(self):
+        # Arrange
+        values = np.linspace(1.0, 2.0, 20)
+        values.setflags(write=False)
+        expected = ExponentialMovingAverage(10)
+        for value in values:
+            expected.update_raw(value)
+
+        # Act
+        self.ema.update_raw_batch(values)
+
+        # Assert
+        assert self.ema.value == pytest.approx(expected.value, rel=1e-12)
+        assert self.ema.count == 20
+
+    def test_update_raw_batch_with_empty_array_does_nothing(self):
+        # Arrange, Act
+        self.ema.update_raw_batch(np.array([], dtype=np.float64))
+
+        # Assert
+        assert self.ema.count == 0
+        assert not self.ema.has_inputs
+        assert self.ema.value == 0.0
+
     def test_reset_successfully_returns_indicator_to_fresh_state(self):
         # Arrange
         for _i in range(1000):
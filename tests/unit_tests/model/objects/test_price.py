@@ -657,6 +657,25 @@ class TestPrice:
         assert str(price) == string
         assert price.precision == precision
 
+    def test_from_str_with_repeated_string_returns_cached_price(self):
+        # Arrange, Act
+        price1 = Price.from_str("1.00010")
+        price2 = Price.from_str("1.00010")
+        price3 = Price.from_str("1.0001")
+
+        # Assert
+        assert price1 is price2
+        assert price1.precision == 5
+        assert price3 is not price1  # Cache keys are the exact strings
+        assert price3 == price1
+        assert price3.precision == 4
+
+    def test_from_str_with_repeated_invalid_string_raises_value_error(self):
+        # Arrange, Act, Assert
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                Price.from_str("1.0000000001")  # Precision 10 is never cached
+
     def test_str_repr(self):
         # Arrange, Act
         price = Price(1.00000, precision=5)
@@ -405,6 +405,21 @@ class TestBarType:
         # Assert
         assert expected == bar_type
 
+    def test_from_str_with_repeated_string_returns_cached_bar_type(self):
+        # Arrange, Act
+        bar_type1 = BarType.from_str("GBP/USD.SIM-1-MINUTE-BID-EXTERNAL")
+        bar_type2 = BarType.from_str("GBP/USD.SIM-1-MINUTE-BID-EXTERNAL")
+
+        # Assert
+        assert bar_type1 is bar_type2
+        assert str(bar_type2) == "GBP/USD.SIM-1-MINUTE-BID-EXTERNAL"
+
+    def test_from_str_with_repeated_invalid_string_raises_value_error(self):
+        # Arrange, Act, Assert
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                BarType.from_str("GBP/USD.SIM-1-MINUTE-INVALID-EXTERNAL")
+
     def test_properties(self):
         # Arrange, Act
         instrument_id = InstrumentId(Symbol("AUD/USD"), Venue("SIM"))